@@ -1,16 +1,59 @@
 import requests
+from requests.adapters import HTTPAdapter
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
-from matplotlib.patches import Rectangle
-import pandas as pd
+from matplotlib.collections import LineCollection, PolyCollection
+from dateutil import tz
 from datetime import datetime, timedelta
 import numpy as np
 import time
-import websocket
-import json
+import websockets
+from websockets.asyncio.client import connect
+import orjson
+import msgspec
 import threading
-from collections import deque
-import matplotlib.animation as animation
+import asyncio
+import socket
+import logging
+import queue
+import heapq
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+from urllib.parse import urlsplit
+
+class CandleMsg(msgspec.Struct):
+    """Fields read from Delta candlestick and ticker messages; everything else is skipped"""
+    type: str
+    symbol: str = ''
+    candle_start_time: int = 0
+    open: float = 0.0
+    high: float = 0.0
+    low: float = 0.0
+    close: float = 0.0
+    volume: float = 0.0
+    price_change_24h: Optional[float] = None
+
+# Candle colors (green for bullish, red for bearish), built once for np.where
+UP_COLOR = np.array('#00ff88')
+DOWN_COLOR = np.array('#ff4444')
+UP_EDGE_COLOR = np.array('#00cc66')
+DOWN_EDGE_COLOR = np.array('#cc3333')
+
+# Delta sends prices as strings, so let msgspec coerce them to floats
+DECODER = msgspec.json.Decoder(CandleMsg, strict=False)
+
+logger = logging.getLogger(__name__)
+
+def start_log_listener(level=logging.INFO):
+    """Send log records through a queue so the WebSocket thread never blocks on stdout"""
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(level)
+    logger.propagate = False
+    
+    listener = QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+    return listener
 
 class LiveETHUSDChart:
     def __init__(self):
@@ -18,17 +61,39 @@ class LiveETHUSDChart:
         self.symbol = 'ETHUSD'
         self.ws_url = "wss://socket.india.delta.exchange"
         
-        # Store live data
-        self.live_candles = deque(maxlen=100)  # Keep last 100 candles
+        # Reuse one keep-alive connection for REST calls
+        self.http = requests.Session()
+        self.http.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=2))
+        
+        # Store live data as a ring buffer of per-field columns (rows of one block)
+        self.max_candles = 100  # Keep last 100 candles
+        self._candles = np.zeros((6, self.max_candles))
+        self._t, self._o, self._h, self._l, self._c, self._v = self._candles
+        self._head = -1  # Slot of the newest candle
+        self._last_t = -1  # Start time of the newest candle
+        self._count = 0
+        
+        # Matplotlib date number of the Unix epoch, for converting candle times
+        self._epoch_x = mdates.date2num(np.datetime64(0, 's'))
         self.current_candle = None
+        self.price_change_24h = None  # Latest 24h change from the ticker feed
         self.ws = None
+        self._loop = None  # Event loop running the WebSocket in its own thread
+        self._closing = None  # Close task scheduled by stop_websocket()
+        self.ws_thread = None
         
         # Chart setup
         self.fig, (self.ax1, self.ax2) = plt.subplots(2, 1, figsize=(16, 10), 
                                                      gridspec_kw={'height_ratios': [3, 1]})
+        self.setup_chart()
         
         # Animation setup
-        self.ani = None
+        self.timer = None
+        self._background = None  # Static figure pixels captured after each full draw
+        self._clock_background = None  # Pixels under the clock badge, for clock-only frames
+        self._clock_box = None
+        self._dirty = threading.Event()  # Set when new candle data is waiting to be drawn
+        self._clock_sec = -1  # Wall-clock second shown on the chart
         
     def fetch_initial_data(self):
         """Fetch initial historical data"""
@@ -44,14 +109,15 @@ class LiveETHUSDChart:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self.http.get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             
             if data['success'] and data['result']:
                 for candle in data['result']:
-                    candle['datetime'] = datetime.fromtimestamp(candle['time'])
-                    self.live_candles.append(candle)
+                    self.append_candle(candle['time'], candle['open'], candle['high'],
+                                       candle['low'], candle['close'], candle['volume'])
+                self._dirty.set()
                 print(f"Loaded {len(data['result'])} historical candles")
                 return True
             else:
@@ -62,69 +128,92 @@ class LiveETHUSDChart:
             print(f"Error fetching historical data: {e}")
             return False
     
+    def write_candle(self, slot, t, open_price, high_price, low_price, close_price, volume):
+        """Store one candle in the given ring buffer slot"""
+        self._t[slot] = t
+        self._o[slot] = open_price
+        self._h[slot] = high_price
+        self._l[slot] = low_price
+        self._c[slot] = close_price
+        self._v[slot] = volume
+    
+    def append_candle(self, t, open_price, high_price, low_price, close_price, volume):
+        """Add a new candle, overwriting the oldest one once the buffer is full"""
+        slot = (self._head + 1) % self.max_candles
+        self.write_candle(slot, t, open_price, high_price, low_price, close_price, volume)
+        self._head = slot
+        self._last_t = t
+        self._count = min(self._count + 1, self.max_candles)
+    
+    def _tail(self):
+        """Return the slot of the oldest candle"""
+        if self._count < self.max_candles:
+            return 0
+        return (self._head + 1) % self.max_candles
+    
+    def ordered(self, columns):
+        """Return ring buffer columns ordered from oldest to newest candle"""
+        if self._count < self.max_candles:
+            return columns[..., :self._count]
+        start = self._tail()
+        return np.concatenate((columns[..., start:], columns[..., :start]), axis=-1)
+    
+    def candle_x(self, t):
+        """Convert candle start times to Matplotlib date numbers"""
+        return t / 86400.0 + self._epoch_x
+    
     def on_websocket_message(self, ws, message):
         """Handle WebSocket messages"""
+        # Skip binary frames, acks and heartbeats before paying for a JSON decode
+        if not isinstance(message, str) or (
+                '"candlestick_1m"' not in message and '"v2/ticker"' not in message):
+            return
+        
         try:
-            data = json.loads(message)
+            msg = DECODER.decode(message)
             
             # Handle candlestick updates
-            if data.get('type') == 'candlestick_1m' and data.get('symbol') == 'ETHUSD':
-                candle = {
-                    'time': data['candle_start_time'] // 1000000,  # Convert to seconds
-                    'open': float(data['open']),
-                    'high': float(data['high']),
-                    'low': float(data['low']),
-                    'close': float(data['close']),
-                    'volume': float(data.get('volume', 0)),
-                    'datetime': datetime.fromtimestamp(data['candle_start_time'] // 1000000)
-                }
+            if msg.type == 'candlestick_1m' and msg.symbol == 'ETHUSD':
+                t = msg.candle_start_time // 1000000  # Convert to seconds
+                values = (t, msg.open, msg.high, msg.low, msg.close, msg.volume)
                 
                 # Update current candle or add new one
-                if self.live_candles and self.live_candles[-1]['time'] == candle['time']:
+                if t == self._last_t:
                     # Update existing candle
-                    self.live_candles[-1] = candle
+                    self.write_candle(self._head, *values)
                 else:
                     # Add new candle
-                    self.live_candles.append(candle)
+                    self.append_candle(*values)
+                self._dirty.set()
                 
-                print(f"🕐 {candle['datetime'].strftime('%H:%M:%S')} | "
-                      f"O: ${candle['open']:.2f} | H: ${candle['high']:.2f} | "
-                      f"L: ${candle['low']:.2f} | C: ${candle['close']:.2f} | "
-                      f"V: {candle['volume']:.1f}")
+                logger.debug("🕐 %d | O: $%.2f | H: $%.2f | L: $%.2f | C: $%.2f | V: %.1f",
+                             t, msg.open, msg.high, msg.low, msg.close, msg.volume)
             
-            # Handle ticker updates
-            elif data.get('type') == 'ticker' and data.get('symbol') == 'ETHUSD':
-                ticker = data
-                print(f"💰 Live Price: ${ticker.get('close', 'N/A')} | "
-                      f"24h Change: {ticker.get('price_change_24h', 'N/A')}%")
+            # Handle ticker updates (shown in the chart's info box)
+            elif msg.type == 'v2/ticker' and msg.symbol == 'ETHUSD':
+                self.price_change_24h = msg.price_change_24h
+                self._dirty.set()
+                logger.debug("💰 Live Price: $%s | 24h Change: %s%%",
+                             msg.close, msg.price_change_24h)
                 
-        except json.JSONDecodeError as e:
-            print(f"Error parsing WebSocket message: {e}")
+        except msgspec.DecodeError as e:
+            logger.error("Error parsing WebSocket message: %s", e)
         except Exception as e:
-            print(f"Error handling WebSocket message: {e}")
+            logger.error("Error handling WebSocket message: %s", e)
     
-    def on_websocket_open(self, ws):
+    async def on_websocket_open(self, ws):
         """Handle WebSocket connection open"""
         print("🔗 WebSocket connected to Delta Exchange")
         
-        # Subscribe to candlestick updates
-        candlestick_subscribe = {
+        # Subscribe to candlestick and ticker updates in a single frame
+        subscribe = {
             "type": "subscribe",
             "payload": {
                 "channels": [
                     {
                         "name": "candlestick_1m",
                         "symbols": ["ETHUSD"]
-                    }
-                ]
-            }
-        }
-        
-        # Subscribe to ticker updates
-        ticker_subscribe = {
-            "type": "subscribe",
-            "payload": {
-                "channels": [
+                    },
                     {
                         "name": "v2/ticker",
                         "symbols": ["ETHUSD"]
@@ -133,8 +222,7 @@ class LiveETHUSDChart:
             }
         }
         
-        ws.send(json.dumps(candlestick_subscribe))
-        ws.send(json.dumps(ticker_subscribe))
+        await ws.send(orjson.dumps(subscribe).decode())  # str is sent as a text frame
         print("📊 Subscribed to ETHUSD live data feeds")
     
     def on_websocket_error(self, ws, error):
@@ -145,85 +233,92 @@ class LiveETHUSDChart:
         """Handle WebSocket connection close"""
         print(f"🔌 WebSocket connection closed: {close_status_code} - {close_msg}")
     
-    def start_websocket(self):
-        """Start WebSocket connection in separate thread"""
-        self.ws = websocket.WebSocketApp(
-            self.ws_url,
-            on_message=self.on_websocket_message,
-            on_error=self.on_websocket_error,
-            on_close=self.on_websocket_close
-        )
-        self.ws.on_open = self.on_websocket_open
+    async def open_socket(self, sockopt):
+        """Connect a TCP socket to the WebSocket host without blocking the event loop"""
+        url = urlsplit(self.ws_url)
+        port = url.port or (443 if url.scheme == 'wss' else 80)
+        loop = asyncio.get_running_loop()
         
-        # Start WebSocket in separate thread
-        ws_thread = threading.Thread(target=self.ws.run_forever)
-        ws_thread.daemon = True
-        ws_thread.start()
-        
-        return ws_thread
+        # Try every resolved address in turn, like socket.create_connection
+        error = None
+        for family, type_, proto, _, address in await loop.getaddrinfo(
+                url.hostname, port, type=socket.SOCK_STREAM):
+            sock = socket.socket(family, type_, proto)
+            try:
+                sock.setblocking(False)
+                for level, option, value in sockopt:
+                    sock.setsockopt(level, option, value)
+                await asyncio.wait_for(loop.sock_connect(sock, address), timeout=10)
+                return sock
+            except (OSError, asyncio.TimeoutError) as e:
+                sock.close()
+                error = e
+            except BaseException:
+                sock.close()
+                raise
+        raise error
     
-    def update_chart(self, frame):
-        """Update chart with live data"""
-        if len(self.live_candles) < 2:
-            return
-        
-        # Clear previous plots
-        self.ax1.clear()
-        self.ax2.clear()
+    async def run_websocket(self, sockopt):
+        """Consume the WebSocket until it closes, writing candles straight into the ring buffer"""
+        try:
+            sock = await self.open_socket(sockopt)
+            
+            # Negotiate permessage-deflate; candle JSON repeats the same keys every frame
+            async with connect(self.ws_url, sock=sock, compression="deflate") as ws:
+                self.ws = ws
+                await self.on_websocket_open(ws)
+                async for message in ws:
+                    # Log and skip a bad frame instead of ending the feed
+                    try:
+                        self.on_websocket_message(ws, message)
+                    except Exception as e:
+                        logger.error("Error handling WebSocket message: %s", e)
+        except (OSError, asyncio.TimeoutError, websockets.exceptions.WebSocketException) as e:
+            self.on_websocket_error(self.ws, e)
         
-        # Convert to DataFrame
-        df = pd.DataFrame(list(self.live_candles))
+        # Let a close requested by stop_websocket() finish before the loop stops
+        if self._closing is not None:
+            await self._closing
         
-        # Plot candlesticks
-        self.plot_candlesticks(self.ax1, df)
+        close = self.ws.protocol.close_rcvd if self.ws else None
+        self.on_websocket_close(self.ws, close and close.code, close and close.reason)
+    
+    def start_websocket(self):
+        """Start WebSocket connection in separate thread"""
+        # Disable Nagle so small frames go out immediately, and use larger socket buffers
+        sockopt = (
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+            (socket.SOL_SOCKET, socket.SO_RCVBUF, 256 * 1024),
+            (socket.SOL_SOCKET, socket.SO_SNDBUF, 256 * 1024),
+        )
         
-        # Plot volume
-        self.plot_volume(self.ax2, df)
+        # Run the asyncio WebSocket consumer in a separate thread; the chart picks up
+        # every candle written since its last frame, so ticks are drawn in batches
+        self._loop = asyncio.new_event_loop()
+        self.ws_thread = threading.Thread(target=self._loop.run_until_complete,
+                                          args=(self.run_websocket(sockopt),))
+        self.ws_thread.daemon = True
+        self.ws_thread.start()
         
-        # Format charts
-        self.format_chart(self.ax1, self.ax2, df)
-    
-    def plot_candlesticks(self, ax, df):
-        """Plot OHLC candlesticks"""
-        for idx, row in df.iterrows():
-            x = mdates.date2num(row['datetime'])
-            open_price = row['open']
-            high_price = row['high']
-            low_price = row['low']
-            close_price = row['close']
-            
-            # Determine color (green for bullish, red for bearish)
-            color = '#00ff88' if close_price >= open_price else '#ff4444'
-            edge_color = '#00cc66' if close_price >= open_price else '#cc3333'
-            
-            # Draw high-low line
-            ax.plot([x, x], [low_price, high_price], color=edge_color, linewidth=1.5)
-            
-            # Draw candle body
-            body_height = abs(close_price - open_price)
-            body_bottom = min(open_price, close_price)
-            
-            if body_height > 0:
-                rect = Rectangle((x - 0.0003, body_bottom), 0.0006, body_height,
-                               facecolor=color, edgecolor=edge_color, alpha=0.8, linewidth=0.5)
-                ax.add_patch(rect)
-            else:
-                # Doji candle (open == close)
-                ax.plot([x - 0.0003, x + 0.0003], [open_price, open_price], 
-                       color=edge_color, linewidth=2)
+        return self.ws_thread
     
-    def plot_volume(self, ax, df):
-        """Plot volume bars"""
-        colors = ['#00ff88' if close >= open else '#ff4444' 
-                 for close, open in zip(df['close'], df['open'])]
-        
-        ax.bar(df['datetime'], df['volume'], color=colors, alpha=0.7, width=0.0006)
+    def request_close(self):
+        """Start the close handshake; runs on the event loop thread"""
+        if self._closing is None:
+            self._closing = self._loop.create_task(self.ws.close())
+    
+    def stop_websocket(self, timeout=5):
+        """Close the WebSocket from outside its event loop thread"""
+        if self.ws and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self.request_close)
+            self.ws_thread.join(timeout)
     
-    def format_chart(self, ax1, ax2, df):
-        """Format chart appearance"""
+    def setup_chart(self):
+        """Create the static chart layout and the artists updated every frame"""
+        ax1, ax2 = self.ax1, self.ax2
+        
         # Main chart formatting
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        ax1.set_title(f'🔴 LIVE: ETHUSD 1-Minute Chart | {current_time}', 
+        ax1.set_title('🔴 LIVE: ETHUSD 1-Minute Chart', 
                      fontsize=16, fontweight='bold', color='#2c3e50')
         ax1.set_ylabel('Price (USD)', fontsize=12, color='#34495e')
         ax1.grid(True, alpha=0.3, color='#bdc3c7')
@@ -236,19 +331,183 @@ class LiveETHUSDChart:
         ax2.set_facecolor('#ecf0f1')
         
         # Format x-axis
-        ax1.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-        ax2.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
+        local_tz = tz.tzlocal()  # Follows DST changes, unlike a fixed startup offset
+        ax1.xaxis_date(local_tz)
+        ax2.xaxis_date(local_tz)
+        ax1.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M', tz=local_tz))
+        ax2.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M', tz=local_tz))
         
         # Rotate x-axis labels
         plt.setp(ax1.xaxis.get_majorticklabels(), rotation=45)
         plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45)
         
-        # Add live price info
-        if not df.empty:
-            current_price = df.iloc[-1]['close']
-            current_volume = df.iloc[-1]['volume']
-            price_change = current_price - df.iloc[0]['open']
-            price_change_pct = (price_change / df.iloc[0]['open']) * 100
+        # Candle wicks, candle bodies and volume bars
+        self.wick_coll = LineCollection([])
+        self.body_coll = PolyCollection([], alpha=0.8, linewidths=0.5)
+        self.volume_coll = PolyCollection([], alpha=0.7, linewidths=0)
+        ax1.add_collection(self.wick_coll)
+        ax1.add_collection(self.body_coll)
+        ax2.add_collection(self.volume_coll)
+        
+        # Live price info
+        self.info_text = ax1.text(0.02, 0.98, '', transform=ax1.transAxes, 
+                                 fontsize=11, verticalalignment='top',
+                                 bbox=dict(boxstyle='round,pad=0.5', facecolor='white', 
+                                           alpha=0.9))
+        
+        # Live indicator with the wall clock (kept inside the axes so it can be blitted)
+        self.live_text = ax1.text(0.98, 0.98, '', transform=ax1.transAxes, 
+                                 fontsize=12, verticalalignment='top', horizontalalignment='right',
+                                 color='red', fontweight='bold',
+                                 bbox=dict(boxstyle='round,pad=0.3', facecolor='white', 
+                                           alpha=0.9, edgecolor='red'))
+        
+        self.animated_artists = [self.wick_coll, self.body_coll, self.volume_coll,
+                                 self.info_text, self.live_text]
+        for artist in self.animated_artists:
+            artist.set_animated(True)
+        self.fig.canvas.mpl_connect('draw_event', self.on_draw)
+    
+    def on_draw(self, event):
+        """Cache the static background after every full redraw"""
+        self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self.draw_live_artists()
+    
+    def draw_live_artists(self):
+        """Draw every live artist, saving the pixels under the clock badge first"""
+        canvas = self.fig.canvas
+        for artist in self.animated_artists:
+            if artist is not self.live_text:
+                artist.axes.draw_artist(artist)
+        
+        # One em of padding covers the badge's round box around the text
+        pad = self.live_text.get_fontsize() * self.fig.dpi / 72
+        self._clock_box = self.live_text.get_window_extent(canvas.get_renderer()).padded(pad)
+        self._clock_background = canvas.copy_from_bbox(self._clock_box)
+        self.ax1.draw_artist(self.live_text)
+    
+    def blit_frame(self):
+        """Repaint only the live artists on top of the cached background"""
+        artists = self.update_chart()
+        if not artists or self._background is None:
+            return
+        
+        canvas = self.fig.canvas
+        if artists == [self.live_text]:
+            # Clock-only frame: repaint just the badge
+            canvas.restore_region(self._clock_background)
+            self.ax1.draw_artist(self.live_text)
+            canvas.blit(self._clock_box)
+            return
+        
+        canvas.restore_region(self._background)
+        self.draw_live_artists()
+        canvas.blit(self.ax1.bbox)
+        canvas.blit(self.ax2.bbox)
+    
+    def update_chart(self):
+        """Update chart with live data"""
+        if self._count < 2:
+            return []
+        
+        now = int(time.time())
+        if not self._dirty.is_set():
+            # Nothing to draw until a candle arrives or the clock ticks over
+            if now == self._clock_sec:
+                return []
+            
+            # Only the clock ticked over
+            self.update_clock(now)
+            return [self.live_text]
+        
+        self._dirty.clear()
+        
+        # Read the whole ring buffer oldest-first in one pass
+        t, o, h, l, c, v = self.ordered(self._candles)
+        x = self.candle_x(t)
+        
+        # Plot candlesticks
+        bull = c >= o
+        colors = np.where(bull, UP_COLOR, DOWN_COLOR)
+        edge_colors = np.where(bull, UP_EDGE_COLOR, DOWN_EDGE_COLOR)
+        self.plot_candlesticks(x, o, h, l, c, colors, edge_colors)
+        
+        # Plot volume
+        self.plot_volume(x, v, colors)
+        
+        # Redraw the static layer only when the data leaves the current view
+        if self.rescale_axes(x, l, h, v):
+            self.fig.canvas.draw()
+        
+        # Format charts
+        self.format_chart()
+        
+        if now != self._clock_sec:
+            self.update_clock(now)
+        
+        return self.animated_artists
+    
+    def plot_candlesticks(self, x, o, h, l, c, colors, edge_colors):
+        """Update the OHLC candlestick collections"""
+        # High-low wicks, plus a flat tick for doji candles (open == close)
+        wicks = np.stack([np.column_stack([x, l]), np.column_stack([x, h])], axis=1)
+        doji = c == o
+        ticks = np.stack([np.column_stack([x[doji] - 0.0003, o[doji]]),
+                          np.column_stack([x[doji] + 0.0003, o[doji]])], axis=1)
+        self.wick_coll.set_segments(np.concatenate([wicks, ticks]))
+        self.wick_coll.set_colors(np.concatenate([edge_colors, edge_colors[doji]]))
+        self.wick_coll.set_linewidths(np.concatenate([np.full(len(x), 1.5), np.full(len(ticks), 2.0)]))
+        
+        # Candle bodies as (N, 4, 2) rectangle vertices
+        body_bottom = np.minimum(o, c)
+        body_top = body_bottom + np.abs(c - o)
+        body = ~doji
+        left, right = x[body] - 0.0003, x[body] + 0.0003
+        bottom, top = body_bottom[body], body_top[body]
+        self.body_coll.set_verts(np.stack([np.column_stack([left, bottom]),
+                                           np.column_stack([left, top]),
+                                           np.column_stack([right, top]),
+                                           np.column_stack([right, bottom])], axis=1))
+        self.body_coll.set_facecolors(colors[body])
+        self.body_coll.set_edgecolors(edge_colors[body])
+    
+    def plot_volume(self, x, v, colors):
+        """Update the volume bars"""
+        left, right, bottom = x - 0.0003, x + 0.0003, np.zeros_like(v)
+        self.volume_coll.set_verts(np.stack([np.column_stack([left, bottom]),
+                                             np.column_stack([left, v]),
+                                             np.column_stack([right, v]),
+                                             np.column_stack([right, bottom])], axis=1))
+        self.volume_coll.set_facecolors(colors)
+    
+    def rescale_axes(self, x, low, high, volume):
+        """Reset axis limits if the data no longer fits; returns True when they changed"""
+        x0, x1 = x[0] - 0.0006, x[-1] + 0.0006
+        y0, y1 = low.min(), high.max()
+        v1 = volume.max()
+        
+        (cx0, cx1), (cy0, cy1) = self.ax1.get_xlim(), self.ax1.get_ylim()
+        if cx0 <= x0 and x1 <= cx1 and cy0 <= y0 and y1 <= cy1 and v1 <= self.ax2.get_ylim()[1]:
+            return False
+        
+        # Leave a few minutes of headroom so new candles do not force a redraw every minute
+        x1 += 5 / (24 * 60)
+        pad = (y1 - y0) * 0.05 or 1.0
+        self.ax1.set_xlim(x0, x1)
+        self.ax2.set_xlim(x0, x1)
+        self.ax1.set_ylim(y0 - pad, y1 + pad)
+        self.ax2.set_ylim(0, v1 * 1.2 or 1.0)
+        return True
+    
+    def format_chart(self):
+        """Update the live price info box"""
+        # Add live price info, read straight from the newest and oldest ring buffer slots
+        if self._count:
+            first_open = self._o[self._tail()]
+            current_price = self._c[self._head]
+            current_volume = self._v[self._head]
+            price_change = current_price - first_open
+            price_change_pct = (price_change / first_open) * 100
             
             # Color based on price change
             change_color = '#27ae60' if price_change >= 0 else '#e74c3c'
@@ -256,18 +515,18 @@ class LiveETHUSDChart:
             info_text = (f"💲 ${current_price:.2f} | "
                         f"📈 {price_change:+.2f} ({price_change_pct:+.2f}%) | "
                         f"📊 Vol: {current_volume:.1f}")
+            if self.price_change_24h is not None:
+                info_text += f" | 24h: {self.price_change_24h:+.2f}%"
             
-            ax1.text(0.02, 0.98, info_text, transform=ax1.transAxes, 
-                    fontsize=11, verticalalignment='top', color=change_color,
-                    bbox=dict(boxstyle='round,pad=0.5', facecolor='white', 
-                             alpha=0.9, edgecolor=change_color))
-            
-            # Add live indicator
-            ax1.text(0.98, 0.98, '🔴 LIVE', transform=ax1.transAxes, 
-                    fontsize=12, verticalalignment='top', horizontalalignment='right',
-                    color='red', fontweight='bold',
-                    bbox=dict(boxstyle='round,pad=0.3', facecolor='white', 
-                             alpha=0.9, edgecolor='red'))
+            self.info_text.set_text(info_text)
+            self.info_text.set_color(change_color)
+            self.info_text.get_bbox_patch().set_edgecolor(change_color)
+    
+    def update_clock(self, now):
+        """Update the wall clock in the live indicator"""
+        current_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        self.live_text.set_text(f'🔴 LIVE | {current_time}')
+        self._clock_sec = now
     
     def start_live_chart(self):
         """Start the live streaming chart"""
@@ -284,12 +543,15 @@ class LiveETHUSDChart:
         # Wait a moment for WebSocket to connect
         time.sleep(2)
         
+        # Fit the axes to the historical candles before the first draw
+        t, o, h, l, c, v = self.ordered(self._candles)
+        self.rescale_axes(self.candle_x(t), l, h, v)
+        
         # Start animation
         print("📈 Starting live chart animation...")
-        self.ani = animation.FuncAnimation(
-            self.fig, self.update_chart, interval=1000,  # Update every 1 second
-            blit=False, cache_frame_data=False
-        )
+        self.timer = self.fig.canvas.new_timer(interval=200)  # Poll every 200 ms, redraw only on changes
+        self.timer.add_callback(self.blit_frame)
+        self.timer.start()
         
         # Show the plot
         plt.tight_layout()
@@ -303,33 +565,48 @@ class AdvancedLiveChart(LiveETHUSDChart):
         super().__init__()
         self.price_alerts = []
         self.trade_signals = []
+        
+        # Pending alerts as heaps: lowest "above" price and highest "below" price on top
+        self._above_alerts = []
+        self._below_alerts = []
     
     def add_price_alert(self, price, alert_type="above"):
         """Add price alert"""
-        self.price_alerts.append({"price": price, "type": alert_type, "triggered": False})
+        alert = {"price": price, "type": alert_type, "triggered": False}
+        self.price_alerts.append(alert)
+        
+        # The insertion index breaks ties so alert dicts are never compared
+        if alert_type == "above":
+            heapq.heappush(self._above_alerts, (price, len(self.price_alerts), alert))
+        elif alert_type == "below":
+            heapq.heappush(self._below_alerts, (-price, len(self.price_alerts), alert))
         print(f"🔔 Price alert added: {alert_type} ${price}")
     
     def check_alerts(self, current_price):
         """Check and trigger price alerts"""
-        for alert in self.price_alerts:
-            if not alert["triggered"]:
-                if alert["type"] == "above" and current_price >= alert["price"]:
-                    print(f"🚨 ALERT: Price ${current_price} is above ${alert['price']}")
-                    alert["triggered"] = True
-                elif alert["type"] == "below" and current_price <= alert["price"]:
-                    print(f"🚨 ALERT: Price ${current_price} is below ${alert['price']}")
-                    alert["triggered"] = True
+        while self._above_alerts and self._above_alerts[0][0] <= current_price:
+            alert = heapq.heappop(self._above_alerts)[2]
+            print(f"🚨 ALERT: Price ${current_price} is above ${alert['price']}")
+            alert["triggered"] = True
+        
+        while self._below_alerts and -self._below_alerts[0][0] >= current_price:
+            alert = heapq.heappop(self._below_alerts)[2]
+            print(f"🚨 ALERT: Price ${current_price} is below ${alert['price']}")
+            alert["triggered"] = True
     
     def on_websocket_message(self, ws, message):
         """Enhanced message handler with alerts"""
         super().on_websocket_message(ws, message)
         
         # Check price alerts
-        if self.live_candles:
-            current_price = self.live_candles[-1]['close']
+        if self._count:
+            current_price = self._c[self._head]
             self.check_alerts(current_price)
 
 if __name__ == "__main__":
+    # Per-tick candle and ticker logs are at DEBUG level
+    log_listener = start_log_listener(logging.INFO)
+    
     print("=" * 60)
     print("🎯 ETHUSD Live Streaming Chart")
     print("=" * 60)
@@ -355,8 +632,9 @@ if __name__ == "__main__":
             
     except KeyboardInterrupt:
         print("\n🛑 Stopping live chart...")
-        if live_chart.ws:
-            live_chart.ws.close()
+        live_chart.stop_websocket()
         print("✅ Live chart stopped")
     except Exception as e:
         print(f"❌ Error: {e}")
+    finally:
+        log_listener.stop()